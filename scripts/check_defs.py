@@ -1,9 +1,28 @@
-import json
-d = json.load(open("app/src/main/assets/words.json", "r", encoding="utf-8"))
-for l in ["3","4","5","6","7"]:
-    words = d.get(l, [])
-    print(f"\n=== {l}-letter words ({len(words)} total) ===")
-    for w in words[:5]:
+import itertools
+import ijson
+
+PATH = "app/src/main/assets/words.json"
+LENGTHS = ["3","4","5","6","7"]
+
+def open_words():
+    f = open(PATH, "rb")
+    if f.read(3) != b"\xef\xbb\xbf":  # skip a UTF-8 BOM if present
+        f.seek(0)
+    return f
+
+# One streaming pass that only counts entries per length (no objects built)
+counts = dict.fromkeys(LENGTHS, 0)
+item_prefixes = {f"{l}.item": l for l in LENGTHS}
+with open_words() as f:
+    for prefix, event, _ in ijson.parse(f):
+        if event == "start_map" and prefix in item_prefixes:
+            counts[item_prefixes[prefix]] += 1
+
+for l in LENGTHS:
+    with open_words() as f:
+        words = list(itertools.islice(ijson.items(f, f"{l}.item"), 5))
+    print(f"\n=== {l}-letter words ({counts[l]} total) ===")
+    for w in words:
         print(f"  {w['word']}: {w['definition'][:60]}")
-    if len(words) > 5:
-        print(f"  ... and {len(words)-5} more")
+    if counts[l] > 5:
+        print(f"  ... and {counts[l]-5} more")
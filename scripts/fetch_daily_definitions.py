@@ -14,14 +14,22 @@ Output: app/src/main/assets/daily_word_definitions.json
 Words with no WordNet definition are simply omitted.
 The UI is expected to show nothing (not "no definition found") when a word is absent.
 
+Lookups are cached in scripts/daily_word_definitions.cache.pkl so reruns only
+query WordNet for new words. Delete that file after changing best_definition().
+
 Usage:
-  pip install nltk
+  pip install nltk ijson orjson
   python scripts/fetch_daily_definitions.py
 """
 
 import json
+import multiprocessing
 import os
+import pickle
+import re
 import sys
+from collections import defaultdict
+from functools import lru_cache
 
 # ---------------------------------------------------------------------------
 # Paths (relative to repo root)
@@ -32,6 +40,7 @@ ASSETS_DIR   = os.path.join(REPO_ROOT, "app", "src", "main", "assets")
 VALID_WORDS  = os.path.join(ASSETS_DIR, "valid_words.json")
 LEVEL_WORDS  = os.path.join(ASSETS_DIR, "words.json")
 OUTPUT_FILE  = os.path.join(ASSETS_DIR, "daily_word_definitions.json")
+CACHE_FILE   = os.path.join(SCRIPT_DIR, "daily_word_definitions.cache.pkl")
 
 # ---------------------------------------------------------------------------
 # NLTK / WordNet setup
@@ -50,6 +59,16 @@ try:
 except ImportError:
     sys.exit("ERROR: NLTK is not installed. Run: pip install nltk")
 
+try:
+    import ijson
+except ImportError:
+    ijson = None  # fall back to json.load for valid_words.json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # fall back to json.dump for the output file
+
 # ---------------------------------------------------------------------------
 # Proper-noun / biography filter
 # Definitions that start with these phrases are almost certainly proper nouns.
@@ -80,8 +99,12 @@ PROPER_NOUN_PREFIXES = (
     "a person who ",
     "a person born",
 )
+# One case-insensitive alternation anchored at the start; avoids lowercasing
+# every candidate definition.
+PROPER_NOUN_RE = re.compile("|".join(map(re.escape, PROPER_NOUN_PREFIXES)), re.IGNORECASE)
 
 
+@lru_cache(maxsize=None)
 def best_definition(word: str) -> str | None:
     """
     Return the best plain-English definition for *word* (lowercase input).
@@ -103,44 +126,98 @@ def best_definition(word: str) -> str | None:
     # Try to find a non-proper-noun definition first
     for s in candidates:
         defn = s.definition()
-        if not any(defn.lower().startswith(p) for p in PROPER_NOUN_PREFIXES):
+        if not PROPER_NOUN_RE.match(defn):
             return defn
 
     # Fallback: just return the first candidate even if it looks proper-nouny
     return candidates[0].definition()
 
 
+def lookup(base: str) -> tuple[str, str | None]:
+    """Pool worker: map a lowercase base form to (base, definition)."""
+    return base, best_definition(base)
+
+
+# ---------------------------------------------------------------------------
+# Persistent lookup cache  { WORD: definition-or-None }
+# ---------------------------------------------------------------------------
+def load_cache() -> dict[str, str | None]:
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            cache = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return {}
+    print(f"Loaded   {len(cache):,} cached lookups  ({CACHE_FILE})")
+    return cache
+
+
+def save_cache(cache: dict[str, str | None]) -> None:
+    with open(CACHE_FILE, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 # ---------------------------------------------------------------------------
 # Build the daily word pool (same logic as DailyChallengeRepository.kt)
 # ---------------------------------------------------------------------------
-def build_daily_pool() -> set[str]:
-    print(f"Loading  valid_words.json …  ({VALID_WORDS})")
-    with open(VALID_WORDS, encoding="utf-8") as f:
-        valid_root = json.load(f)
+POOL_LENGTHS = ("4", "5", "6")
+
+
+def iter_valid_words():
+    """Yield the 4/5/6-letter entries of valid_words.json, streaming if possible."""
+    if ijson is None:
+        with open(VALID_WORDS, encoding="utf-8") as f:
+            valid_root = json.load(f)
+        for length in POOL_LENGTHS:
+            yield from valid_root.get(length, [])
+        return
+
+    # Single streaming pass; arrays for other lengths are skipped, never built.
+    prefixes = {f"{length}.item" for length in POOL_LENGTHS}
+    with open(VALID_WORDS, "rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if event == "string" and prefix in prefixes:
+                yield value
 
+
+def build_daily_pool() -> frozenset[str]:
     print(f"Loading  words.json …  ({LEVEL_WORDS})")
     with open(LEVEL_WORDS, encoding="utf-8-sig") as f:
         level_root = json.load(f)
 
     # Collect all level-word strings (excluded from daily pool)
-    excluded: set[str] = set()
-    for items in level_root.values():
-        for obj in items:
-            excluded.add(obj["word"].upper())
+    excluded = frozenset(obj["word"].upper() for items in level_root.values() for obj in items)
 
     # Build pool: 4/5/6-letter valid words that are NOT level words
-    pool: set[str] = set()
-    for length in ("4", "5", "6"):
-        arr = valid_root.get(length, [])
-        for w in arr:
-            uw = w.upper()
-            if uw not in excluded:
-                pool.add(uw)
+    print(f"Reading  valid_words.json …  ({VALID_WORDS})")
+    pool = frozenset(w.upper() for w in iter_valid_words()) - excluded
 
     print(f"Daily word pool size: {len(pool):,}")
     return pool
 
 
+# ---------------------------------------------------------------------------
+# Output  { "WORD": "definition", ... }  (compact, one trailing newline)
+# ---------------------------------------------------------------------------
+def write_definitions(entries) -> int:
+    """Stream (word, definition) pairs, already sorted by word, to OUTPUT_FILE."""
+    if orjson is not None:
+        encode = orjson.dumps
+    else:
+        def encode(obj):
+            return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    count = 0
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(b"{")
+        for word, defn in entries:
+            if count:
+                f.write(b",")
+            f.write(encode(word) + b":" + encode(defn))
+            count += 1
+        f.write(b"}\n")
+    return count
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -148,31 +225,39 @@ def main():
     pool = build_daily_pool()
     words_sorted = sorted(pool)
 
-    definitions: dict[str, str] = {}
-    no_def_count = 0
-
-    total = len(words_sorted)
-
-    for i, word in enumerate(words_sorted, 1):
-        if i % 1000 == 0 or i == total:
-            print(f"  [{i:>6}/{total}]  coverage so far: {len(definitions):,} definitions", flush=True)
-
-        defn = best_definition(word.lower())
-        if defn:
-            definitions[word] = defn
-        else:
-            no_def_count += 1
-
-    # Sort by key for deterministic output
-    ordered = dict(sorted(definitions.items()))
-
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(ordered, f, ensure_ascii=False, indent=None, separators=(",", ":"))
-        f.write("\n")
-
+    cache = load_cache()
+    todo = [w for w in words_sorted if w not in cache]
+
+    # Inflected forms (CRANES, BOXES, …) share a WordNet noun base with another
+    # word; look each base up once and give its definition to every form.
+    groups: dict[str, list[str]] = defaultdict(list)
+    for word in todo:
+        lw = word.lower()
+        groups[wordnet.morphy(lw, wordnet.NOUN) or lw].append(word)
+    total = len(groups)
+
+    # WordNet is already loaded by the import-time check above, so each worker
+    # starts warm (forked) or loads it once while importing this module (spawned).
+    if todo:
+        print(f"Looking up {total:,} base forms for {len(todo):,} uncached words "
+              f"on {os.cpu_count()} processes …")
+        with multiprocessing.Pool(os.cpu_count()) as p:
+            results = p.imap_unordered(lookup, list(groups), chunksize=256)
+            for i, (base, defn) in enumerate(results, 1):
+                for word in groups[base]:
+                    cache[word] = defn
+                if i % 1000 == 0 or i == total:
+                    print(f"  [{i:>6}/{total}]", flush=True)
+
+    # words_sorted is already in key order, so entries stream straight to disk
+    # without building a second, sorted copy of the definitions.
+    written = write_definitions((w, cache[w]) for w in words_sorted if cache[w])
+    save_cache(cache)
+
+    no_def_count = len(words_sorted) - written
     print()
-    print(f"✓ Wrote {len(ordered):,} definitions  →  {OUTPUT_FILE}")
-    print(f"  Words without a definition: {no_def_count:,} ({no_def_count/total*100:.1f}%)")
+    print(f"✓ Wrote {written:,} definitions  →  {OUTPUT_FILE}")
+    print(f"  Words without a definition: {no_def_count:,} ({no_def_count/len(words_sorted)*100:.1f}%)")
 
 
 if __name__ == "__main__":
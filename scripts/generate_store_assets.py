@@ -5,6 +5,8 @@ Generate Google Play Store assets for Word Journey:
 """
 import math
 import os
+from functools import lru_cache
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 # ── Output directory ──────────────────────────────────────────────────────────
@@ -23,39 +25,55 @@ WHITE     = (255, 255, 255)
 NAVY      = (26, 26, 46)      # #1a1a2e  (website bg, feature graphic bg)
 
 # ── Font helper ───────────────────────────────────────────────────────────────
+FONT_CANDIDATES = {
+    False: ["C:/Windows/Fonts/segoeui.ttf", "C:/Windows/Fonts/arial.ttf", "C:/Windows/Fonts/calibri.ttf"],
+    True:  ["C:/Windows/Fonts/segoeuib.ttf", "C:/Windows/Fonts/arialbd.ttf", "C:/Windows/Fonts/calibrib.ttf"],
+}
+# Resolved once at import so load_font never re-stats missing files.
+FONT_PATHS = {bold: [p for p in paths if os.path.exists(p)] for bold, paths in FONT_CANDIDATES.items()}
+
+@lru_cache(maxsize=None)
 def load_font(size, bold=False):
-    candidates = [
-        "C:/Windows/Fonts/segoeui.ttf"  if not bold else "C:/Windows/Fonts/segoeuib.ttf",
-        "C:/Windows/Fonts/arial.ttf"    if not bold else "C:/Windows/Fonts/arialbd.ttf",
-        "C:/Windows/Fonts/calibri.ttf"  if not bold else "C:/Windows/Fonts/calibrib.ttf",
-    ]
-    for path in candidates:
-        if os.path.exists(path):
-            try:
-                return ImageFont.truetype(path, size)
-            except Exception:
-                pass
+    for path in FONT_PATHS[bold]:
+        try:
+            return ImageFont.truetype(path, size)
+        except Exception:
+            pass
     return ImageFont.load_default()
 
 # ── Rounded rectangle helper ──────────────────────────────────────────────────
-def rounded_rect(draw, xy, radius, fill, outline=None, outline_width=0):
+@lru_cache(maxsize=None)
+def rounded_mask(w, h, radius):
+    """Cached w x h "L" stamp of a filled rounded rect, as Pillow draws it."""
+    stamp = Image.new("L", (w, h), 0)
+    ImageDraw.Draw(stamp).rounded_rectangle((0, 0, w - 1, h - 1), radius=radius, fill=255)
+    return stamp
+
+def rounded_rect(img, xy, radius, fill, outline=None, outline_width=0):
     x0, y0, x1, y1 = xy
-    r = radius
-    draw.rectangle([x0+r, y0, x1-r, y1], fill=fill)
-    draw.rectangle([x0, y0+r, x1, y1-r], fill=fill)
-    draw.ellipse([x0, y0, x0+2*r, y0+2*r], fill=fill)
-    draw.ellipse([x1-2*r, y0, x1, y0+2*r], fill=fill)
-    draw.ellipse([x0, y1-2*r, x0+2*r, y1], fill=fill)
-    draw.ellipse([x1-2*r, y1-2*r, x1, y1], fill=fill)
+    if fill is not None:
+        # Same pixels as rounded_rectangle(fill=...): the binary mask makes
+        # paste write the colour as-is, alpha included, without blending.
+        img.paste(fill, (x0, y0), rounded_mask(x1 - x0 + 1, y1 - y0 + 1, radius))
     if outline and outline_width > 0:
-        draw.arc([x0, y0, x0+2*r, y0+2*r], 180, 270, fill=outline, width=outline_width)
-        draw.arc([x1-2*r, y0, x1, y0+2*r], 270, 360, fill=outline, width=outline_width)
-        draw.arc([x0, y1-2*r, x0+2*r, y1], 90, 180, fill=outline, width=outline_width)
-        draw.arc([x1-2*r, y1-2*r, x1, y1], 0, 90, fill=outline, width=outline_width)
-        draw.line([x0+r, y0, x1-r, y0], fill=outline, width=outline_width)
-        draw.line([x0+r, y1, x1-r, y1], fill=outline, width=outline_width)
-        draw.line([x0, y0+r, x0, y1-r], fill=outline, width=outline_width)
-        draw.line([x1, y0+r, x1, y1-r], fill=outline, width=outline_width)
+        ImageDraw.Draw(img).rounded_rectangle(xy, radius=radius, outline=outline, width=outline_width)
+
+# ── Solid rounded tiles as one RGBA block ─────────────────────────────────────
+def tile_block(rects, colors, radius):
+    """Render filled rounded rects (inclusive pixel boxes) into one RGBA image.
+
+    Returns (image, (x, y)) where (x, y) is the block's offset in the target.
+    """
+    bx0 = min(r[0] for r in rects)
+    by0 = min(r[1] for r in rects)
+    bx1 = max(r[2] for r in rects)
+    by1 = max(r[3] for r in rects)
+    arr = np.zeros((by1 - by0 + 1, bx1 - bx0 + 1, 4), dtype=np.uint8)
+    for (x0, y0, x1, y1), color in zip(rects, colors):
+        tile = arr[y0-by0:y1-by0+1, x0-bx0:x1-bx0+1]
+        tile[..., :3] = color
+        tile[..., 3] = rounded_mask(x1 - x0 + 1, y1 - y0 + 1, radius)
+    return Image.fromarray(arr, "RGBA"), (bx0, by0)
 
 # ── Draw letter centred in a tile ─────────────────────────────────────────────
 def draw_letter(draw, letter, cx, cy, font, color=WHITE):
@@ -81,12 +99,20 @@ def draw_icon(size=512):
     img.paste(bg_img, mask=bg_img)
 
     # ── Subtle radial gradient overlay (lighter centre) ───────────────────────
-    for r in range(int(size*0.5), 0, -3):
-        alpha = int(18 * (1 - r / (size * 0.5)))
-        overlay = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        odraw = ImageDraw.Draw(overlay)
-        odraw.ellipse([cx-r, cy-r, cx+r, cy+r], fill=(255, 220, 120, alpha))
-        img = Image.alpha_composite(img, overlay)
+    # Concentric discs every 3px, alpha rising towards the centre. A pixel is
+    # covered by every disc whose radius reaches it, so its combined alpha is
+    # 1 - prod(1 - a) over those discs; composite that in a single pass.
+    radii = np.arange(int(size*0.5), 0, -3)
+    disc_a = (18 * (1 - radii / (size * 0.5))).astype(int) / 255
+    transmit = np.concatenate(([1.0], np.cumprod(1 - disc_a)))
+    yy, xx = np.ogrid[:size, :size]
+    dist = np.hypot(xx - cx, yy - cy)
+    covered = np.searchsorted(-radii, -dist, side="right")
+    alpha = np.rint(255 * (1 - transmit[covered])).astype(np.uint8)
+    overlay = np.empty((size, size, 4), dtype=np.uint8)
+    overlay[..., :3] = (255, 220, 120)
+    overlay[..., 3] = alpha
+    img = Image.alpha_composite(img, Image.fromarray(overlay, "RGBA"))
     draw = ImageDraw.Draw(img)
 
     # ── Compass outer ring ────────────────────────────────────────────────────
@@ -113,22 +139,27 @@ def draw_icon(size=512):
     tile_pad = int(2 * S)
     tile_r   = max(4, int(2 * S))
 
-    tiles = [
-        # (x0, y0, x1, y1 in 108-viewport coords, fill, letter)
-        (40, 38, 52, 52, GREEN,     "W"),
-        (56, 38, 70, 52, GOLD,      "O"),
-        (40, 56, 52, 70, GOLD,      "R"),
-        (56, 56, 70, 70, GREY_TILE, "D"),
-    ]
+    # Tile boxes in 108-viewport coords, one column per edge (x0, y0, x1, y1)
+    tile_vbox = np.array([
+        (40, 38, 52, 52),
+        (56, 38, 70, 52),
+        (40, 56, 52, 70),
+        (56, 56, 70, 70),
+    ])
+    tile_colors  = [GREEN, GOLD, GOLD, GREY_TILE]
+    tile_letters = "WORD"
     font_tile = load_font(max(8, int(10 * S)), bold=True)
 
-    for (vx0, vy0, vx1, vy1, color, letter) in tiles:
-        px0 = int(vx0 * S) + tile_pad
-        py0 = int(vy0 * S) + tile_pad
-        px1 = int(vx1 * S) - tile_pad
-        py1 = int(vy1 * S) - tile_pad
-        rounded_rect(draw, (px0, py0, px1, py1), tile_r, fill=color)
-        draw_letter(draw, letter, (px0+px1)//2, (py0+py1)//2, font_tile)
+    # Scale every edge at once, padding each box inwards
+    tile_px = (tile_vbox * S).astype(int) + (tile_pad, tile_pad, -tile_pad, -tile_pad)
+    px0, py0, px1, py1 = tile_px.T
+    tcx = (px0 + px1) // 2
+    tcy = (py0 + py1) // 2
+
+    block, origin = tile_block(tile_px.tolist(), tile_colors, tile_r)
+    img.paste(block, origin, block)
+    for i, letter in enumerate(tile_letters):
+        draw_letter(draw, letter, int(tcx[i]), int(tcy[i]), font_tile)
 
     # ── Thin inner glow ring inside compass ring ──────────────────────────────
     glow_r = ring_r - ring_w - 2
@@ -141,18 +172,13 @@ def draw_icon(size=512):
 # ─────────────────────────────────────────────────────────────────────────────
 #  FEATURE GRAPHIC  1024 × 500
 # ─────────────────────────────────────────────────────────────────────────────
-def draw_feature_graphic():
+def draw_feature_graphic(icon_master=None):
     W, H = 1024, 500
-    img = Image.new("RGB", (W, H), NAVY)
-    draw = ImageDraw.Draw(img)
-
     # ── Background: subtle diagonal gradient ─────────────────────────────────
-    for i in range(H):
-        t = i / H
-        r = int(26 + t * 12)
-        g = int(26 + t * 8)
-        b = int(46 + t * 20)
-        draw.line([(0, i), (W, i)], fill=(r, g, b))
+    t = np.arange(H) / H
+    rows = np.stack([26 + t * 12, 26 + t * 8, 46 + t * 20, np.full(H, 255)], axis=1).astype(np.uint8)
+    img = Image.fromarray(np.repeat(rows[:, None, :], W, axis=1), "RGBA")
+    draw = ImageDraw.Draw(img)
 
     # ── Decorative background tiles (scattered, low opacity) ─────────────────
     bg_tiles = [
@@ -169,22 +195,19 @@ def draw_feature_graphic():
         (780, 50, 830, 98, (201, 168, 76, 20),   ""),
         (840, 50, 890, 98, (85, 87, 89, 20),     ""),
     ]
+    # Tiles don't overlap, so they can share one overlay and one composite.
+    overlay = Image.new("RGBA", (W, H), (0, 0, 0, 0))
     for (x0, y0, x1, y1, color, letter) in bg_tiles:
-        overlay = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-        odraw = ImageDraw.Draw(overlay)
-        rounded_rect(odraw, (x0, y0, x1, y1), 8, fill=color[:3] + (color[3],))
-        img = img.convert("RGBA")
-        img = Image.alpha_composite(img, overlay)
-    img = img.convert("RGB")
-    draw = ImageDraw.Draw(img)
+        rounded_rect(overlay, (x0, y0, x1, y1), 8, fill=color[:3] + (color[3],))
+    img.alpha_composite(overlay)
 
     # ── Icon (scaled down) on left ────────────────────────────────────────────
-    icon = draw_icon(320)
-    icon_rgb = icon.convert("RGBA")
+    if icon_master is None:
+        icon_master = draw_icon(512)
+    icon_small = icon_master.resize((320, 320), Image.LANCZOS)
     icon_x = 60
     icon_y = (H - 320) // 2
-    img.paste(icon_rgb, (icon_x, icon_y), mask=icon_rgb)
-    draw = ImageDraw.Draw(img)
+    img.alpha_composite(icon_small, (icon_x, icon_y))
 
     # ── Title: "Word Journey" ─────────────────────────────────────────────────
     title_font = load_font(92, bold=True)
@@ -215,7 +238,7 @@ def draw_feature_graphic():
         ty0 = tile_y0
         tx1 = tx0 + tile_size
         ty1 = ty0 + tile_size
-        rounded_rect(draw, (tx0, ty0, tx1, ty1), 6, fill=col,
+        rounded_rect(img, (tx0, ty0, tx1, ty1), 6, fill=col,
                      outline=(255,255,255,80) if False else None)
         draw_letter(draw, letter, (tx0+tx1)//2, (ty0+ty1)//2, tile_font)
 
@@ -242,12 +265,13 @@ def draw_feature_graphic():
     bh = badge_bbox[3] - badge_bbox[1] + 12
     bx = W - bw - 24
     by = H - bh - 20
-    rounded_rect(draw, (bx, by, bx+bw, by+bh), 8, fill=(40, 35, 20))
-    rounded_rect(draw, (bx, by, bx+bw, by+bh), 8, fill=None,
+    rounded_rect(img, (bx, by, bx+bw, by+bh), 8, fill=(40, 35, 20))
+    rounded_rect(img, (bx, by, bx+bw, by+bh), 8, fill=None,
                  outline=GOLD, outline_width=1)
     draw.text((bx + 12, by + 6), badge_text, font=badge_font, fill=GOLD)
 
-    return img
+    # Drawn in RGBA throughout; Play requires the feature graphic without alpha.
+    return img.convert("RGB")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -261,7 +285,7 @@ if __name__ == "__main__":
     print(f"  Saved: {icon_path}")
 
     print("Generating 1024x500 feature graphic...")
-    fg = draw_feature_graphic()
+    fg = draw_feature_graphic(icon_master=icon)
     fg_path = os.path.join(OUT_DIR, "feature_graphic.png")
     fg.save(fg_path, "PNG")
     print(f"  Saved: {fg_path}")